@@ -22,6 +22,64 @@ interface AdminArea {
   parentCode?: string | null | undefined;
 }
 
+/**
+ * How long a loaded boundary set is reused before it is fetched again.
+ * Boundary data is effectively static, so this only bounds staleness.
+ */
+const GEO_DATA_TTL_MS = 60 * 60 * 1000;
+
+/**
+ * Upper bound on cached boundary sets (the world map plus one per parent
+ * code and level)
+ */
+const MAX_CACHE_ENTRIES = 64;
+
+interface CacheEntry {
+  value: Promise<GeoJSONFeatureCollection | null>;
+  expiresAt: number;
+}
+
+const geoDataCache = new Map<string, CacheEntry>();
+
+/**
+ * Returns the cached result for `key`, or starts `load` and caches it
+ * Entries expire after GEO_DATA_TTL_MS and the least recently used entry is
+ * evicted past MAX_CACHE_ENTRIES. Null results (no children) are cached like
+ * any other; failed loads are dropped so the next call retries.
+ */
+function cachedLoad<T extends GeoJSONFeatureCollection | null>(
+  key: string,
+  load: () => Promise<T>,
+): Promise<T> {
+  const cached = geoDataCache.get(key);
+
+  // Re-insert on every access so the Map's insertion order tracks recency
+  geoDataCache.delete(key);
+
+  if (cached && cached.expiresAt > Date.now()) {
+    geoDataCache.set(key, cached);
+    return cached.value as Promise<T>;
+  }
+
+  const value = load();
+  geoDataCache.set(key, { value, expiresAt: Date.now() + GEO_DATA_TTL_MS });
+
+  if (geoDataCache.size > MAX_CACHE_ENTRIES) {
+    const oldest = geoDataCache.keys().next().value;
+    if (oldest !== undefined) {
+      geoDataCache.delete(oldest);
+    }
+  }
+
+  value.catch(() => {
+    if (geoDataCache.get(key)?.value === value) {
+      geoDataCache.delete(key);
+    }
+  });
+
+  return value;
+}
+
 /**
  * Transforms GraphQL AdminArea responses to GeoJSON FeatureCollection format
  */
@@ -46,8 +104,35 @@ function transformToGeoJSON(adminAreas: AdminArea[]): GeoJSONFeatureCollection {
 
 /**
  * Server Action: Loads the world map (Level 0 - all countries)
+ * The transformed result is kept in memory for GEO_DATA_TTL_MS
  */
 export async function loadWorldMapAction(): Promise<GeoJSONFeatureCollection> {
+  return cachedLoad("world", fetchWorldMap);
+}
+
+/**
+ * Server Action: Loads admin boundaries for a specific country (Level 1)
+ * Loaded boundary sets are kept in memory for GEO_DATA_TTL_MS
+ * @param parentCode - The ISO code of the parent country (e.g., "US", "DE")
+ */
+export async function loadAdminBoundariesAction(
+  parentCode: string,
+  childLevel: number,
+): Promise<GeoJSONFeatureCollection | null> {
+  try {
+    return await cachedLoad(`${childLevel}:${parentCode}`, () =>
+      fetchAdminBoundaries(parentCode, childLevel),
+    );
+  } catch (error) {
+    console.error(`Failed to load admin boundaries for ${parentCode}:`, error);
+    return null;
+  }
+}
+
+/**
+ * Queries and transforms the world map, bypassing the in-memory cache
+ */
+async function fetchWorldMap(): Promise<GeoJSONFeatureCollection> {
   const client = getServerApolloClient();
 
   const { data } = await client.query<AdminAreasQuery>({
@@ -63,28 +148,29 @@ export async function loadWorldMapAction(): Promise<GeoJSONFeatureCollection> {
 }
 
 /**
- * Server Action: Loads admin boundaries for a specific country (Level 1)
- * @param parentCode - The ISO code of the parent country (e.g., "US", "DE")
+ * Queries and transforms admin boundaries, bypassing the in-memory cache
+ * Resolves to null when the parent has no children at this level
  */
-export async function loadAdminBoundariesAction(
+async function fetchAdminBoundaries(
   parentCode: string,
   childLevel: number,
 ): Promise<GeoJSONFeatureCollection | null> {
   const client = getServerApolloClient();
 
-  try {
-    const { data } = await client.query<ChildrenByCodeQuery>({
-      query: ChildrenByCodeDocument,
-      variables: { parentCode, childLevel },
-    });
+  const { data } = await client.query<ChildrenByCodeQuery>({
+    query: ChildrenByCodeDocument,
+    variables: { parentCode, childLevel },
+  });
 
-    if (!data || !data.childrenByCode.length) {
-      return null;
-    }
+  if (!data) {
+    throw new Error(
+      `Failed to load admin boundaries for ${parentCode}: No data returned`,
+    );
+  }
 
-    return transformToGeoJSON(data.childrenByCode);
-  } catch (error) {
-    console.error(`Failed to load admin boundaries for ${parentCode}:`, error);
+  if (!data.childrenByCode.length) {
     return null;
   }
+
+  return transformToGeoJSON(data.childrenByCode);
 }